@@ -8,6 +8,9 @@ Results are saved as a CSV file with detailed information about each paper.
 Requirements:
 - Python 3.7+
 - Dependencies: requests, pandas, python-dateutil
+- Optional: lxml (faster XML parsing), requests-cache (on-disk response cache),
+  orjson (faster JSON decoding), zstandard (zstd transfer compression),
+  pyahocorasick (keyword prefilter)
 - Install with: poetry install
 
 Usage:
@@ -17,6 +20,8 @@ Options:
 -h, --help      Show help message
 -d, --debug     Enable debug mode
 -f, --file      Specify output filename (default: pubmed_results.csv)
+-k, --api-key   NCBI API key (default: $NCBI_API_KEY)
+--no-cache      Bypass the on-disk search response cache
 
 Example:
 python get-papers-list.py -d -f my_results.csv
@@ -24,51 +29,242 @@ python get-papers-list.py -d -f my_results.csv
 
 import argparse
 import csv
+import functools
+import itertools
 import json
 import logging
+import operator
+import os
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import quote_plus
 import time
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.exceptions import HTTPError as URLLib3HTTPError
+    from urllib3.util.request import ACCEPT_ENCODING
+    from urllib3.util.retry import Retry
     from dateutil.parser import parse as parse_date
 except ImportError as e:
     print(f"Error: Missing required dependency: {e}")
     print("Please install dependencies with: poetry install")
     sys.exit(1)
 
+# lxml parses in C via libxml2; fall back to the stdlib parser if it is missing
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+# requests-cache keeps esearch responses on disk between runs
+try:
+    import requests_cache
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
+
+# orjson decodes the esearch payload faster than the stdlib json module
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# pyahocorasick finds any of a set of keywords in a single pass over a string
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+
+# The finders below are XPath, methodcaller or FirstMatch objects. None of them
+# define __get__, so they can live as class attributes without being bound as
+# methods. (Plain functions, and functools.partial from Python 3.14, would be.)
+
+class FirstMatch:
+    """Callable returning the first node a compiled XPath selects, or None."""
+    
+    __slots__ = ('xpath',)
+    
+    def __init__(self, xpath):
+        self.xpath = xpath
+    
+    def __call__(self, elem):
+        matches = self.xpath(elem)
+        return matches[0] if matches else None
+
+
+def compile_find(path: str):
+    """Compile an element path once, returning a callable that finds its first match."""
+    if HAS_LXML:
+        return FirstMatch(ET.XPath(f'({path})[1]'))
+    
+    # ElementPath has no compiled form; find() caches the parsed path internally
+    return operator.methodcaller('find', path)
+
+
+def compile_findall(path: str):
+    """Compile an element path once, returning a callable that finds all its matches."""
+    if HAS_LXML:
+        return ET.XPath(path)
+    
+    return operator.methodcaller('findall', path)
+
+
+def build_keyword_automaton(keywords):
+    """Build an Aho-Corasick automaton over lowercase keywords, or None without pyahocorasick."""
+    if not HAS_AHOCORASICK:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def uncovered_patterns(patterns, keywords):
+    """
+    Return the patterns that do not provably require one of the keywords.
+    
+    A pattern counts as covered when one of its (?:...) groups has a keyword
+    literally inside every alternative.
+    """
+    uncovered = []
+    for pattern in patterns:
+        groups = re.findall(r'\(\?:([^()]*)\)', pattern)
+        if not any(
+            all(any(keyword in alternative for keyword in keywords) for alternative in group.split('|'))
+            for group in groups
+        ):
+            uncovered.append(pattern)
+    return uncovered
+
+
+class RateLimiter:
+    """Spaces out calls so at most `rate` requests start per second across threads."""
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def wait(self) -> None:
+        """Block until the caller may issue its next request."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        
+        if delay > 0:
+            time.sleep(delay)
+
 
 class PubMedFetcher:
     """Fetches and processes research papers from PubMed API."""
     
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
     
+    # NCBI E-utilities limits: IDs per efetch call and requests per second
+    EFETCH_BATCH_SIZE = 200
+    MAX_WORKERS = 8
+    RATE_LIMIT = 3
+    RATE_LIMIT_WITH_KEY = 10
+    # Longer ID lists are sent as POST bodies to avoid URL truncation
+    MAX_GET_ID_LENGTH = 2000
+    # Keep-alive pool large enough for every batch worker plus esearch
+    POOL_SIZE = 16
+    
+    # On-disk HTTP cache for esearch responses (seconds until expiry). efetch is not
+    # cached: CachedSession reads the whole body before returning, which would
+    # defeat streaming the efetch XML through iterparse.
+    CACHE_NAME = 'pubmed_cache.sqlite'
+    CACHE_EXPIRE_AFTER = 86400
+    
     # Common pharmaceutical and biotech company patterns
     PHARMA_BIOTECH_PATTERNS = [
         # Major pharmaceutical companies
-        r'\b(pfizer|novartis|roche|johnson\s*&\s*johnson|j&j|merck|gsk|glaxosmithkline|sanofi|astrazeneca|abbvie|bristol\s*myers\s*squibb|eli\s*lilly|boehringer\s*ingelheim|takeda|bayer|amgen|gilead|biogen|celgene|vertex|regeneron|alexion|incyte|illumina|moderna|biontech)\b',
+        r'\b(?:pfizer|novartis|roche|johnson\s*&\s*johnson|j&j|merck|gsk|glaxosmithkline|sanofi|astrazeneca|abbvie|bristol\s*myers\s*squibb|eli\s*lilly|boehringer\s*ingelheim|takeda|bayer|amgen|gilead|biogen|celgene|vertex|regeneron|alexion|incyte|illumina|moderna|biontech)\b',
         
         # Generic biotech/pharma indicators
-        r'\b(pharmaceuticals?|biotech|biotechnology|therapeutics?|biopharmaceuticals?|life\s*sciences?|drug\s*development|clinical\s*research)\b',
+        r'\b(?:pharmaceuticals?|biotech|biotechnology|therapeutics?|biopharmaceuticals?|life\s*sciences?|drug\s*development|clinical\s*research)\b',
         
         # Research institutions with pharma connections
-        r'\b(pharma|biotech|therapeutic|clinical)\s+(research|institute|center|laboratory|lab)\b',
+        r'\b(?:pharma|biotech|therapeutic|clinical)\s+(?:research|institute|center|laboratory|lab)\b',
         
         # Company suffixes
-        r'\b\w+\s*(pharmaceuticals?|biotech|therapeutics?|biosciences?|lifesciences?)\b'
+        r'\b\w+\s*(?:pharmaceuticals?|biotech|therapeutics?|biosciences?|lifesciences?)\b'
     ]
     
-    def __init__(self, debug: bool = False):
+    # Every PHARMA_BIOTECH_PATTERNS match contains at least one of these literals
+    # (multi-word names contribute one required word); checked below.
+    PHARMA_KEYWORDS = (
+        'pfizer', 'novartis', 'roche', 'johnson', 'j&j', 'merck', 'gsk',
+        'glaxosmithkline', 'sanofi', 'astrazeneca', 'abbvie', 'bristol', 'lilly',
+        'boehringer', 'takeda', 'bayer', 'amgen', 'gilead', 'biogen', 'celgene',
+        'vertex', 'regeneron', 'alexion', 'incyte', 'illumina', 'moderna', 'biontech',
+        'pharma', 'biotech', 'therapeutic', 'life', 'drug', 'clinical', 'bioscience'
+    )
+    assert not uncovered_patterns(PHARMA_BIOTECH_PATTERNS, PHARMA_KEYWORDS), \
+        "PHARMA_KEYWORDS is missing a literal required by PHARMA_BIOTECH_PATTERNS"
+    PHARMA_KEYWORD_AUTOMATON = build_keyword_automaton(PHARMA_KEYWORDS)
+    # Non-ASCII characters re.IGNORECASE equates with ASCII letters that str.lower()
+    # leaves alone or expands ('İ' lowers to 'i' plus a combining dot)
+    KEYWORD_FOLD_TABLE = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's'})
+    
+    # All patterns merged into one alternation so each affiliation is scanned once.
+    # Always the stdlib engine, so \b, \w and case folding follow Unicode rules
+    # regardless of which optional packages are installed.
+    PHARMA_RE = re.compile('|'.join(f'(?:{p})' for p in PHARMA_BIOTECH_PATTERNS), re.IGNORECASE)
+    
+    # Separators between the parts (department, company, city...) of an affiliation
+    COMPANY_DELIMITERS = (',', ';', '\n', '  ')
+    
+    CORRESPONDING_RE = re.compile(r'corresponding', re.IGNORECASE)
+    EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+    
+    # Date elements tried in priority order
+    DATE_TAGS = ('PubDate', 'ArticleDate', 'DateCompleted')
+    # Elements picked up by the single walk over each article (first occurrence wins)
+    ARTICLE_FIELD_TAGS = ('PMID', 'ArticleTitle', 'AuthorList') + DATE_TAGS
+    # All of them live under MedlineCitation; PubmedData (references etc.) is skipped
+    FIND_MEDLINE_CITATION = compile_find('MedlineCitation')
+    
+    # Precompiled child lookups for the per-author extraction
+    FIND_AUTHORS = compile_findall('Author')
+    FIND_LAST_NAME = compile_find('LastName')
+    FIND_FORE_NAME = compile_find('ForeName')
+    FIND_AFFILIATION_INFO = compile_find('AffiliationInfo')
+    FIND_AFFILIATIONS = compile_findall('Affiliation')
+    FIND_ALL_AFFILIATIONS = compile_findall('AffiliationInfo/Affiliation')
+    
+    def __init__(self, debug: bool = False, api_key: Optional[str] = None, use_cache: bool = True):
         """Initialize the PubMed fetcher."""
         self.debug = debug
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'PubMedFetcher/1.0 (research tool)'
-        })
+        self.api_key = api_key
+        self.rate_limiter = RateLimiter(self.RATE_LIMIT_WITH_KEY if api_key else self.RATE_LIMIT)
+        
+        # efetch streams through a plain session; only esearch goes through the cache
+        self.session = self._configure_session(requests.Session())
+        
+        if use_cache and HAS_REQUESTS_CACHE:
+            self.search_session = self._configure_session(requests_cache.CachedSession(
+                self.CACHE_NAME,
+                backend='sqlite',
+                expire_after=self.CACHE_EXPIRE_AFTER,
+                cache_control=True
+            ))
+        else:
+            self.search_session = self.session
         
         # Set up logging
         log_level = logging.DEBUG if debug else logging.INFO
@@ -82,6 +278,30 @@ class PubMedFetcher:
         )
         self.logger = logging.getLogger(__name__)
     
+    def _configure_session(self, session):
+        """Apply the shared headers, connection pool and retry policy to a session."""
+        session.headers.update({
+            'User-Agent': 'PubMedFetcher/1.0 (research tool)',
+            # gzip/deflate, plus br/zstd when urllib3 has a decoder installed for them
+            'Accept-Encoding': ACCEPT_ENCODING
+        })
+        
+        # Reuse connections across worker threads and back off on throttling/server errors
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET', 'POST']),
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            max_retries=retry
+        )
+        session.mount('https://', adapter)
+        return session
+    
     def search_pubmed(self, query: str, max_results: int = 100) -> List[str]:
         """
         Search PubMed for papers matching the query.
@@ -103,12 +323,17 @@ class PubMedFetcher:
             'retmode': 'json',
             'sort': 'relevance'
         }
+        if self.api_key:
+            params['api_key'] = self.api_key
         
         try:
-            response = self.session.get(search_url, params=params, timeout=30)
+            self.rate_limiter.wait()
+            response = self.search_session.get(search_url, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            # Both decoders take the raw bytes, skipping a str copy of the body.
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, handled below
+            data = orjson.loads(response.content) if HAS_ORJSON else json.loads(response.content)
             id_list = data.get('esearchresult', {}).get('idlist', [])
             
             self.logger.info(f"Found {len(id_list)} papers")
@@ -121,21 +346,34 @@ class PubMedFetcher:
             self.logger.error(f"Error parsing search response: {e}")
             return []
     
-    def fetch_paper_details(self, pmids: List[str]) -> List[Dict]:
+    def fetch_paper_details(self, pmids: List[str]) -> Iterator[Dict]:
         """
         Fetch detailed information for a list of PubMed IDs.
         
         Args:
             pmids: List of PubMed IDs
             
-        Returns:
-            List of paper details dictionaries
+        Yields:
+            Paper details dictionaries, batch by batch as they are parsed
         """
         if not pmids:
-            return []
+            return
         
         self.logger.info(f"Fetching details for {len(pmids)} papers")
         
+        batches = [
+            pmids[i:i + self.EFETCH_BATCH_SIZE]
+            for i in range(0, len(pmids), self.EFETCH_BATCH_SIZE)
+        ]
+        
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(batches))) as executor:
+            for batch_papers in executor.map(self._fetch_batch, batches):
+                yield from batch_papers
+    
+    def _fetch_batch(self, pmids: List[str]) -> List[Dict]:
+        """Fetch and parse a single efetch batch of PubMed IDs."""
+        self.logger.debug(f"Requesting efetch batch of {len(pmids)} IDs")
+        
         fetch_url = f"{self.BASE_URL}efetch.fcgi"
         params = {
             'db': 'pubmed',
@@ -143,58 +381,123 @@ class PubMedFetcher:
             'retmode': 'xml',
             'rettype': 'abstract'
         }
+        if self.api_key:
+            params['api_key'] = self.api_key
+        
+        if len(params['id']) > self.MAX_GET_ID_LENGTH:
+            request_args = {'method': 'POST', 'data': params}
+        else:
+            request_args = {'method': 'GET', 'params': params}
         
         try:
-            response = self.session.get(fetch_url, params=params, timeout=60)
-            response.raise_for_status()
-            
-            return self._parse_xml_response(response.text)
+            self.rate_limiter.wait()
+            with self.session.request(url=fetch_url, timeout=60, stream=True, **request_args) as response:
+                response.raise_for_status()
+                
+                # Let urllib3 undo any gzip/deflate transfer encoding on the raw stream
+                response.raw.decode_content = True
+                return self._parse_xml_stream(response.raw)
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, URLLib3HTTPError) as e:
             self.logger.error(f"Error fetching paper details: {e}")
             return []
     
-    def _parse_xml_response(self, xml_content: str) -> List[Dict]:
-        """Parse XML response and extract paper information."""
-        papers = []
-        
-        # Simple XML parsing without external libraries
-        # This is a basic implementation - in production, use xml.etree.ElementTree
-        import xml.etree.ElementTree as ET
+    def _parse_xml_stream(self, stream) -> List[Dict]:
+        """Incrementally parse an efetch XML stream and extract paper information."""
+        records = []
         
         try:
-            root = ET.fromstring(xml_content)
-            
-            for article in root.findall('.//PubmedArticle'):
-                paper_info = self._extract_paper_info(article)
-                if paper_info:
-                    papers.append(paper_info)
+            for article in self._iter_articles(stream):
+                record = self._extract_article_record(article)
+                if record:
+                    records.append(record)
                     
         except ET.ParseError as e:
             self.logger.error(f"Error parsing XML: {e}")
         
-        return papers
+        return self._build_papers(records)
+    
+    def _iter_articles(self, stream):
+        """Yield PubmedArticle elements one at a time, freeing each once consumed."""
+        if HAS_LXML:
+            context = ET.iterparse(
+                stream, events=('end',), tag='PubmedArticle',
+                huge_tree=True, collect_ids=False, remove_blank_text=True
+            )
+            for _, elem in context:
+                yield elem
+                # Drop the processed article and any siblings already handled
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        else:
+            # The stdlib parser has no parent links, so clear from the root instead
+            root = None
+            for event, elem in ET.iterparse(stream, events=('start', 'end')):
+                if root is None:
+                    root = elem
+                elif event == 'end' and elem.tag == 'PubmedArticle':
+                    yield elem
+                    root.clear()
     
-    def _extract_paper_info(self, article_elem) -> Optional[Dict]:
-        """Extract information from a single article XML element."""
+    def _extract_article_record(self, article_elem) -> Optional[Dict]:
+        """Extract the raw fields of a single article XML element."""
         try:
+            # Locate every field of interest in one pass over the article
+            fields = self._collect_article_fields(article_elem)
+            
             # Extract PMID
-            pmid_elem = article_elem.find('.//PMID')
+            pmid_elem = fields.get('PMID')
             pmid = pmid_elem.text if pmid_elem is not None else "N/A"
             
             # Extract title
-            title_elem = article_elem.find('.//ArticleTitle')
+            title_elem = fields.get('ArticleTitle')
             title = title_elem.text if title_elem is not None else "N/A"
             
             # Extract publication date
-            pub_date = self._extract_publication_date(article_elem)
+            pub_date = self._extract_publication_date(fields)
             
             # Extract authors and affiliations
-            authors_info = self._extract_authors_and_affiliations(article_elem)
+            authors_info = self._extract_authors_and_affiliations(fields.get('AuthorList'))
+            
+            return {
+                'pmid': pmid,
+                'title': title,
+                'pub_date': pub_date,
+                'authors': authors_info
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error extracting paper info: {e}")
+            return None
+    
+    def _build_papers(self, records: List[Dict]) -> List[Dict]:
+        """Classify a batch of article records and keep those with pharma/biotech authors."""
+        # Flatten the batch's distinct affiliations so each is classified once;
+        # co-authors usually share the same affiliation line
+        affiliations = list(dict.fromkeys(
+            affiliation
+            for record in records
+            for author in record['authors']
+            for affiliation in author['affiliations']
+        ))
+        pharma_spans = self._match_pharma_batch(affiliations)
+        
+        papers = []
+        for record in records:
+            paper_info = self._build_paper_info(record, pharma_spans)
+            if paper_info:
+                papers.append(paper_info)
+        
+        return papers
+    
+    def _build_paper_info(self, record: Dict, pharma_spans: Dict[str, Tuple[int, int]]) -> Optional[Dict]:
+        """Build the output row for one article record."""
+        try:
+            authors_info = record['authors']
             
             # Check if any author has pharma/biotech affiliation
-            pharma_authors = self._filter_pharma_authors(authors_info)
-            company_affiliations = self._extract_company_names(authors_info)
+            pharma_authors, company_affiliations = self._classify_authors(authors_info, pharma_spans)
             
             # Only include papers with pharma/biotech affiliations
             if not pharma_authors:
@@ -204,9 +507,9 @@ class PubMedFetcher:
             corresponding_email = self._extract_corresponding_email(authors_info)
             
             return {
-                'PubmedID': pmid,
-                'Title': title,
-                'Publication Date': pub_date,
+                'PubmedID': record['pmid'],
+                'Title': record['title'],
+                'Publication Date': record['pub_date'],
                 'Non-academic Author(s)': '; '.join(pharma_authors),
                 'Company Affiliation(s)': '; '.join(company_affiliations),
                 'Corresponding Author Email': corresponding_email
@@ -216,44 +519,59 @@ class PubMedFetcher:
             self.logger.error(f"Error extracting paper info: {e}")
             return None
     
-    def _extract_publication_date(self, article_elem) -> str:
-        """Extract publication date from article element."""
-        # Try different date elements
-        date_elements = [
-            './/PubDate',
-            './/ArticleDate',
-            './/DateCompleted'
-        ]
+    def _collect_article_fields(self, article_elem) -> Dict:
+        """Map each of ARTICLE_FIELD_TAGS to its first element in the article, in a single walk."""
+        fields = {}
         
-        for date_path in date_elements:
-            date_elem = article_elem.find(date_path)
-            if date_elem is not None:
-                year = date_elem.find('Year')
-                month = date_elem.find('Month')
-                day = date_elem.find('Day')
-                
-                if year is not None:
-                    date_str = year.text
-                    if month is not None:
-                        date_str += f"-{month.text}"
-                        if day is not None:
-                            date_str += f"-{day.text}"
-                    return date_str
+        citation = self.FIND_MEDLINE_CITATION(article_elem)
+        root = citation if citation is not None else article_elem
+        
+        # lxml filters the walk by tag in C; the stdlib iter() takes only one tag
+        if HAS_LXML:
+            elems = root.iter(*self.ARTICLE_FIELD_TAGS)
+        else:
+            elems = (elem for elem in root.iter() if elem.tag in self.ARTICLE_FIELD_TAGS)
+        
+        for elem in elems:
+            if elem.tag not in fields:
+                fields[elem.tag] = elem
+        
+        return fields
+    
+    def _extract_publication_date(self, fields: Dict) -> str:
+        """Extract publication date from the article's collected date elements."""
+        for date_tag in self.DATE_TAGS:
+            date_elem = fields.get(date_tag)
+            if date_elem is None:
+                continue
+            
+            year = date_elem.findtext('Year')
+            if year is None:
+                continue
+            
+            # Month only counts with a year, day only with a month
+            parts = [year]
+            for tag in ('Month', 'Day'):
+                value = date_elem.findtext(tag)
+                if value is None:
+                    break
+                parts.append(value)
+            
+            return '-'.join(parts)
         
         return "N/A"
     
-    def _extract_authors_and_affiliations(self, article_elem) -> List[Dict]:
-        """Extract authors and their affiliations."""
+    def _extract_authors_and_affiliations(self, author_list) -> List[Dict]:
+        """Extract authors and their affiliations from an AuthorList element."""
         authors = []
         
-        author_list = article_elem.find('.//AuthorList')
         if author_list is not None:
-            for author_elem in author_list.findall('Author'):
+            for author_elem in self.FIND_AUTHORS(author_list):
                 author_info = {}
                 
                 # Extract author name
-                last_name = author_elem.find('LastName')
-                first_name = author_elem.find('ForeName')
+                last_name = self.FIND_LAST_NAME(author_elem)
+                first_name = self.FIND_FORE_NAME(author_elem)
                 
                 if last_name is not None:
                     name = last_name.text
@@ -263,9 +581,9 @@ class PubMedFetcher:
                 
                 # Extract affiliations
                 affiliations = []
-                affiliation_list = author_elem.find('AffiliationInfo')
+                affiliation_list = self.FIND_AFFILIATION_INFO(author_elem)
                 if affiliation_list is not None:
-                    for affil_elem in affiliation_list.findall('Affiliation'):
+                    for affil_elem in self.FIND_AFFILIATIONS(affiliation_list):
                         if affil_elem.text:
                             affiliations.append(affil_elem.text)
                 
@@ -280,61 +598,82 @@ class PubMedFetcher:
     
     def _is_corresponding_author(self, author_elem) -> bool:
         """Check if author is corresponding author."""
-        # Look for corresponding author indicators
-        for elem in author_elem.iter():
-            if elem.text and 'corresponding' in elem.text.lower():
+        # PubMed has no dedicated tag; the marker lives in the affiliation text
+        for affil_elem in self.FIND_ALL_AFFILIATIONS(author_elem):
+            if affil_elem.text and self.CORRESPONDING_RE.search(affil_elem.text):
                 return True
         return False
     
-    def _filter_pharma_authors(self, authors_info: List[Dict]) -> List[str]:
-        """Filter authors with pharmaceutical/biotech affiliations."""
+    def _classify_authors(
+        self, authors_info: List[Dict], pharma_spans: Dict[str, Tuple[int, int]]
+    ) -> Tuple[List[str], List[str]]:
+        """Collect pharma/biotech author names and company names in one pass over authors."""
         pharma_authors = []
+        # dict keeps companies unique while preserving first-seen order
+        companies = {}
         
         for author in authors_info:
-            if 'name' in author and 'affiliations' in author:
-                for affiliation in author['affiliations']:
-                    if self._is_pharma_affiliation(affiliation):
-                        pharma_authors.append(author['name'])
-                        break
+            has_pharma_affiliation = False
+            
+            for affiliation in author.get('affiliations', []):
+                span = pharma_spans.get(affiliation)
+                if span is None:
+                    continue
+                
+                has_pharma_affiliation = True
+                company = self._parse_company_name(affiliation, span)
+                if company:
+                    companies[company] = None
+            
+            if has_pharma_affiliation and 'name' in author:
+                pharma_authors.append(author['name'])
         
-        return pharma_authors
+        return pharma_authors, list(companies)
     
-    def _is_pharma_affiliation(self, affiliation: str) -> bool:
-        """Check if affiliation is pharmaceutical/biotech related."""
-        affiliation_lower = affiliation.lower()
-        
-        for pattern in self.PHARMA_BIOTECH_PATTERNS:
-            if re.search(pattern, affiliation_lower, re.IGNORECASE):
-                return True
+    def _match_pharma_batch(self, affiliations: List[str]) -> Dict[str, Tuple[int, int]]:
+        """Map each pharmaceutical/biotech affiliation in the batch to its match span."""
+        pharma_spans = {}
+        for affiliation in affiliations:
+            span = self._match_pharma(affiliation)
+            if span is not None:
+                pharma_spans[affiliation] = span
+        
+        return pharma_spans
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _match_pharma(affiliation: str) -> Optional[Tuple[int, int]]:
+        """Memoized PHARMA_RE search; affiliation lines repeat across authors and papers."""
+        if not PubMedFetcher._has_pharma_keyword(affiliation):
+            return None
         
-        return False
+        match = PubMedFetcher.PHARMA_RE.search(affiliation)
+        return match.span() if match else None
     
-    def _extract_company_names(self, authors_info: List[Dict]) -> List[str]:
-        """Extract company names from affiliations."""
-        companies = set()
+    @staticmethod
+    def _has_pharma_keyword(affiliation: str) -> bool:
+        """Cheap prefilter: False means PHARMA_RE cannot match, True means it might."""
+        automaton = PubMedFetcher.PHARMA_KEYWORD_AUTOMATON
+        if automaton is None:
+            return True
+        folded = affiliation.translate(PubMedFetcher.KEYWORD_FOLD_TABLE).lower()
+        return next(automaton.iter(folded), None) is not None
+    
+    def _parse_company_name(self, affiliation: str, span: Tuple[int, int]) -> Optional[str]:
+        """Parse company name as the delimited segment of the affiliation around the match."""
+        start, end = span
+        left, right = 0, len(affiliation)
+        
+        for delimiter in self.COMPANY_DELIMITERS:
+            before = affiliation.rfind(delimiter, 0, start)
+            if before != -1:
+                left = max(left, before + len(delimiter))
+            
+            after = affiliation.find(delimiter, end)
+            if after != -1:
+                right = min(right, after)
         
-        for author in authors_info:
-            if 'affiliations' in author:
-                for affiliation in author['affiliations']:
-                    if self._is_pharma_affiliation(affiliation):
-                        # Extract company name (simplified)
-                        company = self._parse_company_name(affiliation)
-                        if company:
-                            companies.add(company)
-        
-        return list(companies)
-    
-    def _parse_company_name(self, affiliation: str) -> Optional[str]:
-        """Parse company name from affiliation string."""
-        # Simple parsing - extract text before common delimiters
-        for delimiter in [',', ';', '\n', '  ']:
-            if delimiter in affiliation:
-                parts = affiliation.split(delimiter)
-                for part in parts:
-                    if self._is_pharma_affiliation(part):
-                        return part.strip()
-        
-        return affiliation.strip()
+        return affiliation[left:right].strip() or None
     
     def _extract_corresponding_email(self, authors_info: List[Dict]) -> str:
         """Extract corresponding author email."""
@@ -344,19 +683,21 @@ class PubMedFetcher:
             if author.get('is_corresponding', False):
                 # Look for email in affiliations
                 for affiliation in author.get('affiliations', []):
-                    email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', affiliation)
+                    email_match = self.EMAIL_RE.search(affiliation)
                     if email_match:
                         return email_match.group()
         
         return "N/A"
     
-    def save_to_csv(self, papers: List[Dict], filename: str) -> None:
-        """Save papers to CSV file."""
-        if not papers:
+    def save_to_csv(self, papers: Iterable[Dict], filename: str) -> int:
+        """Stream papers to CSV file, returning the number of rows written."""
+        papers = iter(papers)
+        first = next(papers, None)
+        if first is None:
             self.logger.warning("No papers to save")
-            return
+            return 0
         
-        self.logger.info(f"Saving {len(papers)} papers to {filename}")
+        self.logger.info(f"Saving papers to {filename}")
         
         fieldnames = [
             'PubmedID',
@@ -366,22 +707,32 @@ class PubMedFetcher:
             'Company Affiliation(s)',
             'Corresponding Author Email'
         ]
+        # Pull each row out as a tuple in column order in one C-level call
+        row_of = operator.itemgetter(*fieldnames)
         
+        count = 0
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(papers)
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
+                for paper in itertools.chain([first], papers):
+                    writer.writerow(row_of(paper))
+                    count += 1
             
-            self.logger.info(f"Successfully saved results to {filename}")
+            self.logger.info(f"Successfully saved {count} papers to {filename}")
             
         except IOError as e:
             self.logger.error(f"Error saving CSV file: {e}")
+        
+        return count
     
     def run(self, query: str, filename: str = "pubmed_results.csv", max_results: int = 100) -> None:
         """Main execution method."""
         self.logger.info("Starting PubMed paper fetcher")
         
+        # Keep the affiliation cache bounded to a single run
+        self._match_pharma.cache_clear()
+        
         # Search for papers
         pmids = self.search_pubmed(query, max_results)
         
@@ -389,17 +740,18 @@ class PubMedFetcher:
             self.logger.warning("No papers found for the query")
             return
         
-        # Fetch detailed information
+        # Fetch detailed information lazily so rows are written as batches are parsed
         papers = self.fetch_paper_details(pmids)
+        first = next(papers, None)
         
-        if not papers:
+        if first is None:
             self.logger.warning("No papers with pharma/biotech affiliations found")
             return
         
         # Save results
-        self.save_to_csv(papers, filename)
+        count = self.save_to_csv(itertools.chain([first], papers), filename)
         
-        self.logger.info(f"Process completed. Found {len(papers)} relevant papers.")
+        self.logger.info(f"Process completed. Found {count} relevant papers.")
 
 
 def main():
@@ -417,6 +769,16 @@ def main():
         default='pubmed_results.csv',
         help='Output filename (default: pubmed_results.csv)'
     )
+    parser.add_argument(
+        '-k', '--api-key',
+        default=os.environ.get('NCBI_API_KEY'),
+        help='NCBI API key, raises the rate limit to 10 requests/s (default: $NCBI_API_KEY)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the on-disk search response cache'
+    )
     
     args = parser.parse_args()
     
@@ -442,7 +804,7 @@ def main():
         print("Invalid number, using default value")
     
     # Initialize and run fetcher
-    fetcher = PubMedFetcher(debug=args.debug)
+    fetcher = PubMedFetcher(debug=args.debug, api_key=args.api_key, use_cache=not args.no_cache)
     
     try:
         fetcher.run(query, args.file, max_results)